@@ -9,7 +9,7 @@ Classes:
     DocumentGenerator: Responsible for generating individual documents and updating the CSV file with the file paths.
     EmailSender: Responsible for creating email drafts and sending emails to recipients with the generated documents attached.
 Usage:
-    - Ensure that the required libraries (os, csv, pandas, PyPDF2, win32com) are installed before running the script.
+    - Ensure that the required libraries (os, pandas, pypdfium2, win32com) are installed before running the script.
     - Update the file paths and email details in the main section of the script as needed.
     - Run the script to generate documents and send emails.
 Author: Margaux Edwards
@@ -20,13 +20,125 @@ Email: margaux.edwards@robocupjunior.org.au
 # CSV file format:
 # Team Name,Organisation,Division,Award,Mentor_Name,Mentor_Email
 
+import logging
+import logging.handlers
 import os
-import csv
+import queue
+import string
+import sys
+import threading
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
-from PyPDF2 import PdfReader, PdfWriter
+import pypdfium2 as pdfium
+import pythoncom
 import win32com.client as win32
 
 
+logger = logging.getLogger(__name__)
+
+# Passed as extra to log messages that should be written out straight away, such as progress
+# and the end of each step, rather than waiting in _BufferedLogHandler's buffer
+FLUSH = {"flush": True}
+
+# Number of created Documents between progress messages
+PROGRESS_INTERVAL = 50
+
+# Number of log messages buffered before they are written out when run as a script
+LOG_BUFFER_SIZE = 100
+
+
+class _BufferedLogHandler(logging.handlers.MemoryHandler):
+    """
+    MemoryHandler that also writes out its buffer when a message is logged with extra=FLUSH.
+    """
+
+    def shouldFlush(self, record):
+        return super().shouldFlush(record) or getattr(record, "flush", False)
+
+# ProcessPoolExecutor rejects more than 61 worker processes on Windows
+MAX_PDF_WORKERS = 61
+
+# Buffer size for writing each document and the updated CSV, so they are written in a few large writes
+WRITE_BUFFER_SIZE = 1 << 20
+
+# Flags for creating output documents; O_SEQUENTIAL and O_BINARY only exist on Windows
+OUTPUT_FLAGS = (os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+                | getattr(os, "O_SEQUENTIAL", 0) | getattr(os, "O_BINARY", 0))
+
+# Source PDF parsed once in each worker process by _load_source
+_source_pdf = None
+
+# Marks the end of a queue of generated Documents or of emails to send
+_DONE = object()
+
+
+def _load_source(pdf_data):
+    """
+    Parse the source PDF from memory once per worker process.
+
+    Args:
+        pdf_data (bytes): Contents of the input PDF file.
+    """
+    global _source_pdf
+    _source_pdf = pdfium.PdfDocument(pdf_data)
+
+
+def _send_worker(send_email, emails, stop, failures):
+    """
+    Send emails from a queue on this thread's own Outlook dispatch until _DONE is received.
+
+    Args:
+        send_email (callable): Sends one email, e.g. EmailSender._send_email.
+        emails (queue.Queue): Recipient email address, email body and attachment path of each email.
+        stop (threading.Event): Set once any email fails, after which no more emails are sent.
+        failures (list): Receives the recipient and error of each email that failed.
+    """
+    # Each sending thread joins its own single-threaded COM apartment
+    pythoncom.CoInitializeEx(pythoncom.COINIT_APARTMENTTHREADED)
+    create_item = None
+    try:
+        while True:
+            email = emails.get()
+            if email is _DONE:
+                break
+            if stop.is_set():
+                logger.warning("Email not sent to: %s (an earlier email failed)", email[0])
+                continue
+            try:
+                if create_item is None:
+                    # Dispatch reuses the early-bound wrapper generated by EmailSender's EnsureDispatch
+                    create_item = win32.Dispatch('outlook.application').CreateItem
+                send_email(create_item, *email)
+            except Exception as error:
+                failures.append((email[0], error))
+                stop.set()
+    finally:
+        # Release the dispatch before leaving the apartment
+        create_item = None
+        pythoncom.CoUninitialize()
+
+
+def _write_page(args):
+    """
+    Write a single page of the source PDF to its own document.
+
+    Args:
+        args (tuple): Index of the page in the source PDF and the output file path.
+
+    Returns:
+        str: The output file path.
+    """
+    page_index, output_path = args
+    document = pdfium.PdfDocument.new()
+    try:
+        document.import_pages(_source_pdf, pages=[page_index])
+        with os.fdopen(os.open(output_path, OUTPUT_FLAGS, 0o666), "wb", buffering=WRITE_BUFFER_SIZE) as output_file:
+            document.save(output_file)
+    finally:
+        document.close()
+    return output_path
+
+
 class DocumentGenerator:
     def __init__(self, pdf_path, csv_file, output_folder, document_type):
         """
@@ -42,83 +154,295 @@ class DocumentGenerator:
         self.csv_file = csv_file
         self.output_folder = output_folder
         self.document_type = document_type
+        self.data = None  # Participant details with file paths, set once all Documents are generated
+        self.updated_csv_file = None  # Path of the updated CSV, set once all Documents are generated
 
     def generate_Documents(self):
         """
         Generate Documents by splitting a multi-page PDF and naming each page
         according to the Name column in the provided CSV file. Adds the output
         file path to the CSV for future reference.
+
+        Returns:
+            tuple: Path of the updated CSV, and the updated data as a pandas.DataFrame
+                that can be passed to EmailSender.from_dataframe.
         """
-        # Ensure the output folder exists or create it
-        if not os.path.exists(self.output_folder):
-            os.makedirs(self.output_folder)
-            print(f"Output folder created: {self.output_folder}")
-        else:
-            print(f"Output folder already exists: {self.output_folder}")
+        for _ in self.iter_Documents():
+            pass
+        return self.updated_csv_file, self.data
 
-        # Read the CSV file and extract the data
-        with open(self.csv_file, "r") as file:
-            reader = csv.DictReader(file)
-            rows = list(reader)  # Convert to a list of dictionaries
-            fieldnames = reader.fieldnames + ["File Path"]  # Add a new "File Path" column
+    def iter_Documents(self, queue_size=16):
+        """
+        Generate Documents as in generate_Documents, yielding each participant's details as soon
+        as their document has been created so emails can be sent while the rest are still being
+        generated. The updated CSV is written once all Documents have been generated.
 
-        # Load the PDF
-        reader = PdfReader(self.pdf_path)
-        total_pages = len(reader.pages)
+        Args:
+            queue_size (int): Maximum number of created Documents waiting to be consumed.
+
+        Yields:
+            dict: The participant's details from the CSV, including the "File Path" of their document.
+        """
+        # Ensure the output folder exists or create it
+        os.makedirs(self.output_folder, exist_ok=True)
+        logger.info("Output folder ready: %s", self.output_folder)
+
+        # Read the CSV file and extract the data, keeping every cell as the text in the file
+        data = pd.read_csv(self.csv_file, dtype=str, keep_default_na=False)
+
+        # Read the PDF from disk once; the bytes are handed to each worker process
+        with open(self.pdf_path, "rb") as pdf_file:
+            pdf_data = pdf_file.read()
+        # PDFium reads the page count from the root page tree without loading any pages
+        source = pdfium.PdfDocument(pdf_data)
+        try:
+            total_pages = len(source)
+        finally:
+            source.close()
 
         # Ensure the number of rows matches the number of pages
-        if len(rows) != total_pages:
+        if len(data) != total_pages:
             raise ValueError("The number of entries in the CSV doesn't match the number of pages in the PDF.")
 
-        # Split the PDF and name each page with the corresponding Name from the CSV
-        for i, row in enumerate(rows):
-            writer = PdfWriter()
-            writer.add_page(reader.pages[i])
-
-            # Create the output path using the Name column and document type
-            name = row["Team Name"]
-            output_file_name = f"{name}_{self.document_type}.pdf"
-            output_path = os.path.join(self.output_folder, output_file_name)
-            with open(output_path, "wb") as output_file:
-                writer.write(output_file)
+        # Name each page with the corresponding Name from the CSV in a new "File Path" column,
+        # made absolute once here so emails can attach the files directly
+        prefix = os.path.join(os.path.abspath(self.output_folder), "")
+        data["File Path"] = prefix + data["Team Name"] + f"_{self.document_type}.pdf"
+
+        # Rows sharing a file path (e.g. several mentors of one team) share a single document,
+        # written once from the last of their pages, as that page used to overwrite the others
+        unique_paths = data["File Path"].drop_duplicates(keep="last")
+        jobs = list(zip(unique_paths.index.tolist(), unique_paths.tolist()))
+        rows_by_path = data.groupby("File Path", sort=False).indices
+
+        # Teams in different divisions with the same name would share a file, hiding one team's document
+        divisions_per_path = data.groupby("File Path", sort=False)["Division"].nunique()
+        for output_path in divisions_per_path.index[divisions_per_path > 1]:
+            positions = rows_by_path[output_path]
+            logger.warning("Teams in different divisions share the file %s (pages %s); only page %d is used.",
+                           output_path, ", ".join(str(position + 1) for position in positions),
+                           positions[-1] + 1)
+
+        # Split the PDF on a producer thread, queueing the path of each created document
+        created = queue.Queue(maxsize=queue_size)
+        stop = threading.Event()
+        producer = threading.Thread(target=self._split_pdf, args=(pdf_data, jobs, created, stop), daemon=True)
+        producer.start()
+
+        rows = data.to_dict("records")
+        finished = False
+        try:
+            while True:
+                item = created.get()
+                if item is _DONE:
+                    finished = True
+                    break
+                if isinstance(item, Exception):
+                    raise item
+                for position in rows_by_path[item]:
+                    yield rows[position]
+        finally:
+            if not finished:
+                # Stopped early or failed: tell the producer to stop, and drain the queue so it is
+                # never left blocked on a full queue with the process pool still running
+                stop.set()
+                while created.get() is not _DONE:
+                    pass
+            producer.join()
+
+        # Write the updated data with the new "File Path" column back to the CSV
+        updated_csv_file = os.path.join(self.output_folder, f"{self.document_type}_Documents_Updated.csv")
+        # A large file buffer turns pandas' many small writes into a few large ones
+        with open(updated_csv_file, "w", newline="", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as csv_output:
+            data.to_csv(csv_output, index=False)
+        self.data = data  # Keep the updated data so it can be handed to EmailSender without re-reading the CSV
+        self.updated_csv_file = updated_csv_file
 
-            # Add the file path to the current row
-            row["File Path"] = output_path
-            print(f"Created: {output_path}")
+        logger.info("All Documents generated successfully. Updated CSV saved at: %s", updated_csv_file,
+                    extra=FLUSH)
 
-        # Write the updated rows with the new "File Path" column back to the CSV
-        updated_csv_file = os.path.join(self.output_folder, f"{self.document_type}_Documents_Updated.csv")
-        with open(updated_csv_file, "w", newline="") as file:
-            writer = csv.DictWriter(file, fieldnames=fieldnames)
-            writer.writeheader()  # Write the header
-            writer.writerows(rows)  # Write all rows with the updated data
+    @staticmethod
+    def _split_pdf(pdf_data, jobs, created, stop):
+        """
+        Split the PDF across worker processes, since every page is written independently.
 
-        print(f"All Documents generated successfully. Updated CSV saved at: {updated_csv_file}")
-        return updated_csv_file
+        Args:
+            pdf_data (bytes): Contents of the input PDF file.
+            jobs (list): Page index in the PDF and output file path of each document to create.
+            created (queue.Queue): Receives the path of each created document, any error
+                raised while splitting, and finally _DONE.
+            stop (threading.Event): Set when the created Documents are no longer being consumed.
+        """
+        # Each worker re-imports this script and copies the PDF, so start no more than there are jobs
+        total = len(jobs)
+        max_workers = max(1, min(total, os.cpu_count() or 1, MAX_PDF_WORKERS))
+        try:
+            with ProcessPoolExecutor(max_workers=max_workers, initializer=_load_source,
+                                     initargs=(pdf_data,)) as executor:
+                for i, output_path in enumerate(executor.map(_write_page, jobs, chunksize=8)):
+                    if stop.is_set():
+                        # Nobody is consuming the Documents any more, so skip the ones not yet written
+                        executor.shutdown(cancel_futures=True)
+                        break
+                    # Report progress periodically rather than for every document
+                    if (i + 1) % PROGRESS_INTERVAL == 0 or i + 1 == total:
+                        logger.info("Created %d/%d Documents", i + 1, total, extra=FLUSH)
+                    created.put(output_path)
+        except Exception as error:
+            created.put(error)
+        finally:
+            created.put(_DONE)
 
 
 class EmailSender:
+    chunk_size = 1000  # Number of CSV rows read at a time when sending from a CSV file
+    send_workers = 4  # Number of threads sending emails, each with its own Outlook dispatch
+
     def __init__(self, csv_file, email_subject, email_body_template, sender_name, sender_title, organisation):
         """
         Initialize the EmailSender with the email details and recipient data.
 
         Args:
-            csv_file (str): Path to the CSV file containing recipient data.
+            csv_file (str or None): Path to the CSV file containing recipient data, or None when
+                recipients are only passed to send_documents.
             email_subject (str): Subject of the email.
             email_body_template (str): Template for the email body.
             sender_name (str): Name of the sender.
             sender_title (str): Title of the sender.
             organisation (str): organisation name.
         """
-        self.data = pd.read_csv(csv_file)
+        # The CSV file is read lazily in chunks when emails are created, to bound memory use
+        self._csv_path = csv_file
+        self.data = None
         self.email_subject = email_subject
         self.email_body_template = email_body_template
         self.sender_name = sender_name
         self.sender_title = sender_title
         self.organisation = organisation
 
-        # Ensure proper file paths
-        self.data['File Path'] = self.data['File Path'].apply(lambda x: x.replace('\\', '/'))
+        self._outlook = None  # Outlook dispatch, created on first use by the outlook property
+
+        # Parsed email_body_template, refreshed by _template_parts whenever the template changes
+        self._parsed_template = None
+        self._template_pieces = None
+
+    @property
+    def outlook(self):
+        """
+        The Outlook application, dispatched once with early binding on first use and shared
+        between create_drafts and send_emails. This also generates the early-bound wrapper
+        used by the email sending threads.
+        """
+        if self._outlook is None:
+            self._outlook = win32.gencache.EnsureDispatch('outlook.application')
+        return self._outlook
+
+    @classmethod
+    def from_dataframe(cls, data, email_subject, email_body_template, sender_name, sender_title, organisation):
+        """
+        Create an EmailSender from recipient data that is already loaded, such as the data
+        returned by DocumentGenerator.generate_Documents, without reading a CSV file.
+
+        Args:
+            data (pandas.DataFrame): Recipient data, including the "File Path" column.
+            email_subject (str): Subject of the email.
+            email_body_template (str): Template for the email body.
+            sender_name (str): Name of the sender.
+            sender_title (str): Title of the sender.
+            organisation (str): organisation name.
+
+        Returns:
+            EmailSender: The email sender for the given data.
+        """
+        sender = cls(None, email_subject, email_body_template, sender_name, sender_title, organisation)
+        sender.data = cls._absolute_paths(data.copy())
+        return sender
+
+    @staticmethod
+    def _absolute_paths(data):
+        """
+        Convert the file paths to absolute paths once for safety, rather than for every email.
+
+        Args:
+            data (pandas.DataFrame): Recipient data with a "File Path" column.
+
+        Returns:
+            pandas.DataFrame: The same data with absolute file paths.
+        """
+        data['File Path'] = data['File Path'].map(os.path.abspath)
+        return data
+
+    def _iter_chunks(self):
+        """
+        Yield the recipient data in chunks, streaming the CSV file when one was given.
+
+        Yields:
+            pandas.DataFrame: The next chunk of recipient data.
+        """
+        if self._csv_path is None:
+            yield self.data
+            return
+
+        for chunk in pd.read_csv(self._csv_path, dtype=str, keep_default_na=False, chunksize=self.chunk_size):
+            yield self._absolute_paths(chunk)
+
+    def _template_parts(self):
+        """
+        Parse the email body template into literal text and placeholders, once per template
+        rather than once per email.
+
+        Returns:
+            list: (literal_text, field_name, format_spec, conversion) tuples from string.Formatter.parse.
+        """
+        template = self.email_body_template
+        if template is not self._parsed_template:
+            self._template_pieces = list(string.Formatter().parse(template))
+            self._parsed_template = template
+        return self._template_pieces
+
+    def _format_body(self, mentor_name, division):
+        """
+        Generate an email body by replacing placeholders with actual data.
+
+        Args:
+            mentor_name (str): Name of the recipient.
+            division (str): Division of the recipient's team.
+
+        Returns:
+            str: The email body.
+        """
+        fields = {
+            'mentor_name': mentor_name,
+            'division': division,
+            'sender_name': self.sender_name,
+            'sender_title': self.sender_title,
+            'organisation': self.organisation
+        }
+        pieces = []
+        for literal_text, field_name, format_spec, conversion in self._template_parts():
+            pieces.append(literal_text)
+            if field_name is not None:
+                value = fields[field_name]
+                if conversion:
+                    value = {'s': str, 'r': repr, 'a': ascii}[conversion](value)
+                pieces.append(format(value, format_spec))
+        return "".join(pieces)
+
+    def _format_bodies(self, data):
+        """
+        Generate the email body for every row of data.
+
+        Args:
+            data (pandas.DataFrame): Recipient data to generate email bodies for.
+
+        Returns:
+            list: The email body for each row of data.
+        """
+        format_body = self._format_body
+        return [
+            format_body(mentor_name, division)
+            for mentor_name, division in zip(data['Mentor_Name'].tolist(), data['Division'].tolist())
+        ]
 
     def create_drafts(self, sample_size=None):
         """
@@ -127,75 +451,140 @@ class EmailSender:
         Args:
             sample_size (int, optional): Number of random rows to use for draft testing. If None, drafts are created for all rows.
         """
-        outlook = win32.Dispatch('outlook.application')
-
         if sample_size:
-            data = self.data.sample(n=sample_size)  # Randomly sample rows for testing
+            # Sampling needs every row, so the chunks are combined before picking rows for testing
+            chunks = [pd.concat(self._iter_chunks()).sample(n=sample_size)]
         else:
-            data = self.data
-
-        for _, row in data.iterrows():
-            # Create email
-            mail = outlook.CreateItem(0)
-            mail.To = row['Mentor_Email']
-            mail.Subject = self.email_subject
-
-            # Generate the email body by replacing placeholders with actual data
-            email_body = self.email_body_template.format(
-                mentor_name=row['Mentor_Name'],
-                division=row['Division'],
-                sender_name=self.sender_name,
-                sender_title=self.sender_title,
-                organisation=self.organisation
-            )
-            mail.Body = email_body
-
-            filepath = row['File Path']
-            filepath = os.path.abspath(filepath)  # Convert to an absolute path for safety
-            # Attach the PDF
-            mail.Attachments.Add(filepath)
-
-            # Save the email as a draft
-            mail.Save()
-            print(f"Draft created for: {row['Mentor_Email']}")
-
-        print("Draft emails created successfully! Check your Outlook Drafts folder.")
+            chunks = self._iter_chunks()
 
-    def send_emails(self):
+        create_item = self.outlook.CreateItem  # Resolve the COM method once, not per email
+        email_subject = self.email_subject
+
+        for data in chunks:
+            # Prepare the chunk's email bodies before making any Outlook calls
+            email_bodies = self._format_bodies(data)
+
+            for mail_to, email_body, filepath in zip(data['Mentor_Email'].tolist(), email_bodies,
+                                                     data['File Path'].tolist()):
+                # Create email
+                mail = create_item(0)
+                mail.To = mail_to
+                mail.Subject = email_subject
+                mail.Body = email_body
+
+                # Attach the PDF
+                mail.Attachments.Add(filepath)
+
+                # Save the email as a draft
+                mail.Save()
+                logger.info("Draft created for: %s", mail_to)
+
+        logger.info("Draft emails created successfully! Check your Outlook Drafts folder.", extra=FLUSH)
+
+    def _send_email(self, create_item, mail_to, email_body, filepath):
         """
-        Send emails in bulk based on the given data.
+        Send a single email from the current email sending thread.
+
+        Args:
+            create_item (callable): CreateItem method of the thread's Outlook dispatch.
+            mail_to (str): Email address of the recipient.
+            email_body (str): Body of the email.
+            filepath (str): Absolute path of the PDF to attach.
         """
-        outlook = win32.Dispatch('outlook.application')
+        # Create email
+        mail = create_item(0)
+        mail.To = mail_to
+        mail.Subject = self.email_subject
+        mail.Body = email_body
 
-        for _, row in self.data.iterrows():
-            # Create email
-            mail = outlook.CreateItem(0)
-            mail.To = row['Mentor_Email']
-            mail.Subject = self.email_subject
+        # Attach the PDF
+        mail.Attachments.Add(filepath)
 
-            # Generate the email body by replacing placeholders with actual data
-            email_body = self.email_body_template.format(
-                mentor_name=row['Mentor_Name'],
-                division=row['Division'],
-                sender_name=self.sender_name,
-                sender_title=self.sender_title,
-                organisation=self.organisation
-            )
-            mail.Body = email_body
+        # Send the email
+        mail.Send()
+        logger.info("Email sent to: %s", mail_to)
 
-            filepath = row['File Path']
-            filepath = os.path.abspath(filepath)  # Convert to an absolute path for safety
-            # Attach the PDF
-            mail.Attachments.Add(filepath)
+    def _send_all(self, emails):
+        """
+        Send emails from send_workers threads, each with its own Outlook dispatch, so one email is
+        composed while another is sent. Sending stops at the first failed email.
 
-            # Send the email
-            mail.Send()
-            print(f"Email sent to: {row['Mentor_Email']}")
+        Args:
+            emails (iterable): Recipient email address, email body and attachment path of each email.
 
-        print("All emails sent successfully!")
+        Raises:
+            RuntimeError: If any email failed to send. Each failed recipient is logged, as is each
+                queued recipient that was skipped; later recipients were not emailed.
+        """
+        _ = self.outlook  # Ensure Outlook is running and its early-bound wrapper exists before the threads start
+
+        pending = queue.Queue(maxsize=self.send_workers * 2)
+        stop = threading.Event()
+        failures = []
+        workers = [
+            threading.Thread(target=_send_worker, args=(self._send_email, pending, stop, failures))
+            for _ in range(self.send_workers)
+        ]
+        for worker in workers:
+            worker.start()
+
+        try:
+            for email in emails:
+                if stop.is_set():
+                    break
+                pending.put(email)
+        finally:
+            for _ in workers:
+                pending.put(_DONE)
+            for worker in workers:
+                worker.join()
+
+        if failures:
+            for mail_to, error in failures:
+                logger.error("Email failed for: %s (%s)", mail_to, error)
+            raise RuntimeError(f"{len(failures)} email(s) failed to send. Sending stopped at the first failure; "
+                               "only recipients logged as \"Email sent to\" received an email.") from failures[0][1]
+
+    def send_emails(self):
+        """
+        Send emails in bulk based on the given data.
+        """
+        def emails():
+            for data in self._iter_chunks():
+                # Prepare the chunk's email bodies before making any Outlook calls
+                email_bodies = self._format_bodies(data)
+                yield from zip(data['Mentor_Email'].tolist(), email_bodies, data['File Path'].tolist())
+
+        self._send_all(emails())
+        logger.info("All emails sent successfully!", extra=FLUSH)
+
+    def send_documents(self, documents):
+        """
+        Send an email for each document as it arrives, e.g. from DocumentGenerator.iter_Documents,
+        so emails are already being sent while the remaining Documents are generated.
+
+        Args:
+            documents (iterable): Recipient details, each a dict with the CSV columns and the absolute "File Path".
+        """
+        self._send_all(
+            (document['Mentor_Email'], self._format_body(document['Mentor_Name'], document['Division']),
+             document['File Path'])
+            for document in documents
+        )
+        logger.info("All emails sent successfully!", extra=FLUSH)
 
 
 if __name__ == "__main__":
+    # StreamHandler flushes after every message, so buffer per-item messages and write them to stdout
+    # in batches; progress, the end of each step, warnings and errors are written straight away.
+    # pythonw has no stdout.
+    if sys.stdout is not None:
+        stdout_handler = logging.StreamHandler(sys.stdout)
+        stdout_handler.setFormatter(logging.Formatter("%(message)s"))
+        logging.basicConfig(level=logging.INFO, handlers=[
+            _BufferedLogHandler(LOG_BUFFER_SIZE, flushLevel=logging.WARNING, target=stdout_handler)
+        ])
+
     # Document Generation
     pdf_path = r"XXX.pdf"  # Replace with your input PDF file path. Ths PDF should contain all the documents to be generated in a single file. This can easily be a bulk generated file from Canva.
     csv_file = r"XXX.csv"  # Replace with your input CSV file path. All the details from the registration system
@@ -203,7 +592,7 @@ if __name__ == "__main__":
     document_type = "XXX"  # Replace with the desired document type (e.g., 'Participation', 'Volunteer', 'Award')
 
     cert_generator = DocumentGenerator(pdf_path, csv_file, output_folder, document_type)
-    updated_csv = cert_generator.generate_Documents()
+    updated_csv, documents_data = cert_generator.generate_Documents()  # The updated CSV is kept for reference only
     
     sender_name = "XXX TEMPLATE SENDER NAME XXX"  # Name of the sender
     sender_title = "XXX TEMPLATE SENDER TITLE XXX"  # Title of the sender
@@ -222,10 +611,15 @@ XXX TEMPLATE MESSAGE XXX
 {organisation}
 """
 
-    email_sender = EmailSender(updated_csv, email_subject, email_body_template, sender_name, sender_title, organisation)
+    email_sender = EmailSender.from_dataframe(documents_data, email_subject, email_body_template, sender_name, sender_title, organisation)
 
     # Create Drafts (Optional)
     email_sender.create_drafts(sample_size=3)  # Uncomment to create drafts for testing
 
     # Send Emails (Uncomment to send emails in bulk)
     email_sender.send_emails()
+
+    # Alternatively, send each email as soon as its document is created, overlapping document
+    # generation with sending. This replaces generate_Documents, create_drafts and send_emails above.
+    # email_sender = EmailSender(None, email_subject, email_body_template, sender_name, sender_title, organisation)
+    # email_sender.send_documents(cert_generator.iter_Documents())